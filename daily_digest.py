@@ -1,16 +1,29 @@
 import os
-import json
+import re
+import asyncio
+import hashlib
+import ssl
 import smtplib
+import time
 import logging
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from datetime import datetime, timedelta, timezone
+import threading
+import functools
+import multiprocessing
+import itertools
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from email.message import EmailMessage
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from html import escape as _esc
 from zoneinfo import ZoneInfo
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
-    from icalendar import Calendar
+    import certifi
+    import httpx
+    import orjson
     from dateutil import parser as dateparser
 except Exception as e:
     print("Missing dependencies. Please run: pip install -r requirements.txt")
@@ -18,67 +31,497 @@ except Exception as e:
 
 # -------------- Helpers --------------
 
+_UTC = timezone.utc
+
+@functools.lru_cache(maxsize=8)
+def _tz(s):
+    return ZoneInfo(s)
+
 def load_config():
     here = os.path.dirname(os.path.abspath(__file__))
     cfg_path = os.path.join(here, "config.json")
-    with open(cfg_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(cfg_path, "rb") as f:
+        return orjson.loads(f.read())
 
 def human_time(dt, tz_str):
-    tz = ZoneInfo(tz_str)
+    tz = _tz(tz_str)
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc).astimezone(tz)
+        dt = dt.replace(tzinfo=_UTC).astimezone(tz)
     else:
         dt = dt.astimezone(tz)
     return dt.strftime("%I:%M %p").lstrip("0")
 
 def human_date(dt, tz_str):
-    tz = ZoneInfo(tz_str)
+    tz = _tz(tz_str)
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc).astimezone(tz)
+        dt = dt.replace(tzinfo=_UTC).astimezone(tz)
     else:
         dt = dt.astimezone(tz)
     return dt.strftime("%A, %B %d, %Y")
 
+_FAST_FORMATS = ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d")
+
+def _fast_parse(s):
+    # Most reminder dumps are ISO-8601; only fall back to dateutil for free-form text
+    try:
+        return datetime.fromisoformat(s.replace("Z", "+00:00"))
+    except ValueError:
+        pass
+    for f in _FAST_FORMATS:
+        try:
+            return datetime.strptime(s, f)
+        except ValueError:
+            pass
+    return dateparser.parse(s)
+
 def sanitize_webcal(url):
     # iCloud public calendars often use webcal://; swap for https://
     return url.replace("webcal://", "https://")
 
-# -------------- Data Fetchers --------------
+HDRS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36"
+}
 
-def fetch_events(ics_urls, tz_str, start_dt, end_dt):
-    events = []
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36"
-    }
-    for url in ics_urls:
+# Shared pooled session so repeat requests to the same host reuse the connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504]),
+))
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "daily-digest")
+
+def _cache_paths(url):
+    key = hashlib.sha1(url.encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}.json"), os.path.join(CACHE_DIR, f"{key}.ics")
+
+def _load_cache_meta(meta_path):
+    try:
+        with open(meta_path, "rb") as f:
+            meta = orjson.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    # Validators are useless without the body they describe
+    if "sha1" not in meta or not os.path.exists(meta.get("body_path", "")):
+        return {}
+    return meta
+
+def _save_cache_meta(meta_path, meta):
+    try:
+        with open(meta_path, "wb") as f:
+            f.write(orjson.dumps(meta))
+    except OSError:
+        logging.warning("Could not write ICS cache to %s", CACHE_DIR)
+
+MEMO_PATH = os.path.join(CACHE_DIR, "parsed.json")
+# Bump when the shape of memoised events/reminders changes
+_MEMO_VERSION = 4
+_MEMO_LOCK = threading.Lock()
+
+def _read_memo():
+    try:
+        with open(MEMO_PATH, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+def _memo(name, key, fn):
+    # Return the stored result for name if it was computed for the same key
+    with _MEMO_LOCK:
+        entry = _read_memo().get(name)
+    if entry and entry.get("key") == key:
+        return entry["value"]
+
+    result = fn()
+    with _MEMO_LOCK:
+        # Re-read so concurrent callers don't drop each other's entries
+        memo = _read_memo()
+        memo[name] = {"key": key, "value": result}
         try:
-            resp = requests.get(sanitize_webcal(url), headers=headers, timeout=20, verify=False)
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_path = MEMO_PATH + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps(memo))
+            os.replace(tmp_path, MEMO_PATH)
+        except OSError:
+            logging.warning("Could not write parse cache to %s", MEMO_PATH)
+    return result
+
+# -------------- Data Fetchers --------------
+
+async def _fetch_one(client, url):
+    meta_path, body_path = _cache_paths(url)
+    cached = _load_cache_meta(meta_path)
+    headers = {}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("lm"):
+        headers["If-Modified-Since"] = cached["lm"]
+
+    try:
+        async with client.stream("GET", sanitize_webcal(url), headers=headers) as resp:
+            if resp.status_code == 304:
+                # Unchanged since last run; reuse the cached body
+                return cached["body_path"], cached["sha1"]
             resp.raise_for_status()
-            cal = Calendar.from_ical(resp.content)
-        except Exception as e:
-            logging.exception("Failed to fetch/parse ICS from %s", url)
+            # Stream straight to disk so the whole feed is never held in memory
+            digest = hashlib.sha1()
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_path = body_path + ".part"
+            with open(tmp_path, "wb") as f:
+                async for chunk in resp.aiter_bytes(64 * 1024):
+                    digest.update(chunk)
+                    f.write(chunk)
+            os.replace(tmp_path, body_path)
+            meta = {
+                "etag": resp.headers.get("ETag"),
+                "lm": resp.headers.get("Last-Modified"),
+                "body_path": body_path,
+                "sha1": digest.hexdigest(),
+            }
+    except httpx.HTTPError:
+        if not cached:
+            raise
+        # Stale beats missing: keep the calendar in the digest on timeouts/5xx
+        logging.warning("Fetching %s failed; using the cached copy", url, exc_info=True)
+        return cached["body_path"], cached["sha1"]
+
+    _save_cache_meta(meta_path, meta)
+    return body_path, meta["sha1"]
+
+async def _gather(ics_urls):
+    # Download every feed at once; failures come back as exceptions, not raised.
+    # HTTP/2 lets feeds on the same host (e.g. several iCloud calendars) share
+    # one verified TLS connection.
+    async with httpx.AsyncClient(
+        http2=True,
+        verify=ssl.create_default_context(cafile=certifi.where()),
+        timeout=20,
+        headers=HDRS,
+        follow_redirects=True,
+    ) as client:
+        return await asyncio.gather(*[_fetch_one(client, u) for u in ics_urls], return_exceptions=True)
+
+# Only these VEVENT properties are used by the digest
+_ICS_TEXT_PROPS = {"SUMMARY": "summary", "LOCATION": "location", "DESCRIPTION": "description"}
+_ICS_DATE_PROPS = {"DTSTART": "dtstart", "DTEND": "dtend"}
+_ICS_ESCAPE = re.compile(r"\\([\\;,nN])")
+
+def _ics_unescape(value):
+    return _ICS_ESCAPE.sub(lambda m: "\n" if m.group(1) in "nN" else m.group(1), value)
+
+def _ics_lines(raw_lines):
+    # Yield logical content lines, joining folded continuation lines.
+    # Folds may split a multi-byte UTF-8 sequence, so join as bytes and
+    # decode only once the logical line is complete.
+    current = None
+    for raw in raw_lines:
+        line = raw.rstrip(b"\r\n")
+        if line[:1] in (b" ", b"\t") and current is not None:
+            current.extend(line[1:])
+            continue
+        if current is not None:
+            yield current.decode("utf-8", errors="replace")
+        current = bytearray(line)
+    if current is not None:
+        yield current.decode("utf-8", errors="replace")
+
+def _split_prop(line):
+    # NAME;PARAM=x;PARAM="y:z":VALUE -> ("NAME", {"PARAM": ...}, "VALUE")
+    in_quotes = False
+    for i, ch in enumerate(line):
+        if ch == '"':
+            in_quotes = not in_quotes
+        elif ch == ":" and not in_quotes:
+            head, value = line[:i], line[i + 1:]
+            break
+    else:
+        return None, {}, ""
+    name, *raw_params = head.split(";")
+    params = {}
+    for p in raw_params:
+        k, _, v = p.partition("=")
+        params[k.upper()] = v.strip('"')
+    return name.upper(), params, value
+
+def _parse_ics_dt(s):
+    # ICS always uses the basic YYYYMMDDTHHMMSS[Z] form; slicing beats strptime
+    return datetime(int(s[0:4]), int(s[4:6]), int(s[6:8]), int(s[9:11]), int(s[11:13]), int(s[13:15]),
+                    tzinfo=_UTC if s.endswith("Z") else None)
+
+_ICS_WEEKDAYS = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+
+def _ics_offset(value):
+    # +HHMM[SS] / -HHMM[SS] -> timedelta
+    sign = -1 if value.startswith("-") else 1
+    v = value.lstrip("+-")
+    return sign * timedelta(hours=int(v[0:2]), minutes=int(v[2:4]), seconds=int(v[4:6] or 0))
+
+def _nth_weekday(year, month, nth, weekday):
+    if nth > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (nth - 1))
+    last = (date(year, month + 1, 1) if month < 12 else date(year + 1, 1, 1)) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7 + 7 * (-nth - 1))
+
+class _VTimezone(tzinfo):
+    # tzinfo built from a feed's VTIMEZONE block, for TZIDs that are not IANA
+    # names (Outlook/Exchange use Windows names like "Eastern Standard Time").
+    # Each rule is a STANDARD/DAYLIGHT onset: (start, offset_from, offset_to, yearly)
+    # where yearly is None for a one-off onset or (month, nth, weekday, until).
+
+    def __init__(self, name, rules):
+        self._name = name
+        self._rules = sorted(rules, key=lambda r: r[0])
+
+    def __reduce__(self):
+        # Scanned events cross process boundaries in _scan_feeds
+        return _VTimezone, (self._name, self._rules)
+
+    def _onset(self, rule, year):
+        start, _, _, yearly = rule
+        if yearly is None:
+            return start
+        month, nth, weekday, until = yearly
+        if year < start.year:
+            return None
+        if nth is None:
+            day = date(year, month, start.day)
+        else:
+            day = _nth_weekday(year, month, nth, weekday)
+        onset = datetime.combine(day, start.time())
+        return None if until and onset > until else onset
+
+    def utcoffset(self, dt):
+        local = dt.replace(tzinfo=None)
+        latest, offset = None, self._rules[0][1]
+        # The most recent onset at or before the wall time decides the offset
+        for rule in self._rules:
+            for year in (local.year, local.year - 1):
+                onset = self._onset(rule, year)
+                if onset is not None and onset <= local and (latest is None or onset > latest):
+                    latest, offset = onset, rule[2]
+        return offset
+
+    def dst(self, dt):
+        return timedelta(0)
+
+    def tzname(self, dt):
+        return self._name
+
+def _vtimezone(tzid, parts):
+    rules = []
+    for part in parts:
+        start = _parse_ics_dt(part["DTSTART"])
+        yearly = None
+        rrule = dict(p.partition("=")[::2] for p in part.get("RRULE", "").split(";") if p)
+        if rrule.get("FREQ") == "YEARLY":
+            nth = weekday = None
+            byday = rrule.get("BYDAY", "")
+            if byday[-2:] in _ICS_WEEKDAYS:
+                nth, weekday = int(byday[:-2] or 1), _ICS_WEEKDAYS[byday[-2:]]
+            until = _parse_ics_dt(rrule["UNTIL"]).replace(tzinfo=None) if "UNTIL" in rrule else None
+            yearly = (int(rrule.get("BYMONTH", start.month)), nth, weekday, until)
+        rules.append((start, _ics_offset(part["TZOFFSETFROM"]), _ics_offset(part["TZOFFSETTO"]), yearly))
+    return _VTimezone(tzid, rules)
+
+def _ics_date(value, params, zones):
+    if params.get("VALUE") == "DATE" or len(value) == 8:
+        return date(int(value[0:4]), int(value[4:6]), int(value[6:8]))
+    dt = _parse_ics_dt(value)
+    if dt.tzinfo is not None:
+        return dt
+    tzid = params.get("TZID")
+    if tzid:
+        if tzid not in zones:
+            try:
+                zones[tzid] = _tz(tzid)
+            except Exception:
+                # Non-Olson TZID with no VTIMEZONE seen (yet); the scanner
+                # retries it once the whole file has been read
+                zones[tzid] = None
+        if zones[tzid] is not None:
+            return dt.replace(tzinfo=zones[tzid])
+    return dt
+
+def _starts_after(value, end):
+    if isinstance(value, datetime):
+        return (value if value.tzinfo else value.replace(tzinfo=_UTC)) > end
+    return value > end.date()
+
+def _scan_vtimezone_line(line, vtz, zones):
+    # Collect a VTIMEZONE's STANDARD/DAYLIGHT parts. IANA TZIDs still resolve
+    # through zoneinfo; the block is only used for names zoneinfo doesn't know.
+    if line in ("BEGIN:STANDARD", "BEGIN:DAYLIGHT"):
+        vtz["parts"].append({})
+    elif line in ("END:STANDARD", "END:DAYLIGHT"):
+        pass
+    elif line == "END:VTIMEZONE":
+        tzid = vtz["tzid"]
+        # A None entry means an event used this TZID before its VTIMEZONE
+        if not tzid or zones.get(tzid) is not None:
+            return
+        try:
+            zones[tzid] = _tz(tzid)
+        except Exception:
+            try:
+                zones[tzid] = _vtimezone(tzid, vtz["parts"]) if vtz["parts"] else None
+            except (KeyError, ValueError):
+                logging.warning("Unreadable VTIMEZONE for %s; treating as floating", tzid)
+                zones[tzid] = None
+    else:
+        name, params, value = _split_prop(line)
+        if vtz["parts"]:
+            vtz["parts"][-1][name] = value
+        elif name == "TZID":
+            vtz["tzid"] = value
+
+def _scan_vevents(raw_lines, start, end):
+    # Lightweight VEVENT scanner: picks out just the fields the digest needs
+    # and drops events that start after the window without reading further.
+    # Events starting before `start` may still overlap it, so the caller
+    # does the full window test.
+    zones = {}
+    # Events with a TZID not resolvable when read; held until the file is done
+    # since RFC 5545 allows the VTIMEZONE to come after the events using it
+    deferred = []
+    event = None
+    depth = 0
+    skip = False
+    vtz = None
+    for line in _ics_lines(raw_lines):
+        # Component names are case-insensitive; normalise boundary lines only
+        if line[:6].upper() == "BEGIN:" or line[:4].upper() == "END:":
+            line = line.upper()
+        if event is None:
+            if line == "BEGIN:VEVENT":
+                event, depth, skip = {}, 0, False
+            elif line == "BEGIN:VTIMEZONE":
+                vtz = {"tzid": None, "parts": []}
+            elif vtz is not None:
+                _scan_vtimezone_line(line, vtz, zones)
+                if line == "END:VTIMEZONE":
+                    vtz = None
+            continue
+        if line.startswith("BEGIN:"):
+            depth += 1
+            continue
+        if line.startswith("END:"):
+            if depth:
+                depth -= 1
+                continue
+            if skip:
+                pass
+            elif "_pending" in event:
+                deferred.append(event)
+            else:
+                yield event
+            event = None
+            continue
+        if depth or skip:
+            # Properties of nested VALARMs etc., or an event already rejected
             continue
 
-        for component in cal.walk():
-            if component.name != "VEVENT":
+        name, params, value = _split_prop(line)
+        if name in _ICS_TEXT_PROPS:
+            event[_ICS_TEXT_PROPS[name]] = _ics_unescape(value).strip()
+        elif name in _ICS_DATE_PROPS:
+            key = _ICS_DATE_PROPS[name]
+            try:
+                event[key] = _ics_date(value, params, zones)
+            except ValueError:
+                skip = True
                 continue
-            summary = str(component.get("summary", "")).strip()
-            location = str(component.get("location", "")).strip()
-            description = str(component.get("description", "")).strip()
+            tzid = params.get("TZID")
+            if tzid and isinstance(event[key], datetime) and event[key].tzinfo is None:
+                event.setdefault("_pending", {})[key] = tzid
+            elif name == "DTSTART" and _starts_after(event["dtstart"], end):
+                skip = True
+
+    for event in deferred:
+        for key, tzid in event.pop("_pending").items():
+            if zones.get(tzid) is not None:
+                event[key] = event[key].replace(tzinfo=zones[tzid])
+        if "dtstart" in event and _starts_after(event["dtstart"], end):
+            continue
+        yield event
+
+def fetch_events(ics_urls, tz_str, start_dt, end_dt):
+    feeds = []
+    digest = hashlib.sha1()
+    for url, result in zip(ics_urls, asyncio.run(_gather(ics_urls))):
+        if isinstance(result, BaseException):
+            logging.error("Failed to fetch ICS from %s", url, exc_info=result)
+            digest.update(b"\0")
+            continue
+        body_path, body_sha1 = result
+        digest.update(bytes.fromhex(body_sha1))
+        feeds.append((url, body_path))
+
+    key = [_MEMO_VERSION, digest.hexdigest(), tz_str, start_dt.isoformat(), end_dt.isoformat()]
+    return _memo("events", key, lambda: _parse_events(feeds, tz_str, start_dt, end_dt))
+
+def _scan_feed(body_path, start_dt, end_dt):
+    # Module-level so it can run in a worker process.
+    # Iterate the cached file line by line rather than loading it whole.
+    with open(body_path, "rb") as f:
+        return list(_scan_vevents(f, start_dt, end_dt))
+
+# Below this much cached ICS in total, scanning inline beats starting workers
+# (a spawned worker re-imports httpx, requests, orjson and dateutil)
+_SCAN_POOL_MIN_BYTES = 16 * 1024 * 1024
+
+def _feeds_size(feeds):
+    total = 0
+    for url, body_path in feeds:
+        try:
+            total += os.path.getsize(body_path)
+        except OSError:
+            # _scan_feed will report the missing file
+            pass
+    return total
+
+def _scan_feeds(feeds, start_dt, end_dt):
+    # Scanning is pure-Python CPU work, so spread large feeds across cores.
+    # Returns the scanned events (or the exception raised) per feed, in order.
+    workers = min(len(feeds), os.cpu_count() or 1)
+    if workers <= 1 or _feeds_size(feeds) < _SCAN_POOL_MIN_BYTES:
+        results = []
+        for url, body_path in feeds:
+            try:
+                results.append(_scan_feed(body_path, start_dt, end_dt))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    # fetch_events runs in one of main()'s worker threads, so never fork here:
+    # a lock held by another thread at fork time would deadlock the child
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as ex:
+        futures = [ex.submit(_scan_feed, body_path, start_dt, end_dt) for url, body_path in feeds]
+        return [f.exception() or f.result() for f in futures]
+
+def _parse_events(feeds, tz_str, start_dt, end_dt):
+    events = []
+    tz = _tz(tz_str)
+    for (url, body_path), scanned in zip(feeds, _scan_feeds(feeds, start_dt, end_dt)):
+        if isinstance(scanned, BaseException):
+            logging.error("Failed to parse ICS from %s", url, exc_info=scanned)
+            continue
 
-            dtstart = component.get("dtstart")
-            dtend = component.get("dtend")
+        for component in scanned:
+            summary = component.get("summary", "")
+            location = component.get("location", "")
+            description = component.get("description", "")
 
             # Handle all-day (date) vs timed (datetime)
-            if hasattr(dtstart, "dt"):
-                s = dtstart.dt
-            else:
+            s = component.get("dtstart")
+            if s is None:
                 continue
 
-            if hasattr(dtend, "dt"):
-                e = dtend.dt
-            else:
+            e = component.get("dtend")
+            if e is None:
                 # assume 1 hour if missing
                 if isinstance(s, datetime):
                     e = s + timedelta(hours=1)
@@ -86,40 +529,53 @@ def fetch_events(ics_urls, tz_str, start_dt, end_dt):
                     e = s
 
             # Convert date-only to a datetime window within the day in tz
-            tz = ZoneInfo(tz_str)
             if isinstance(s, datetime):
-                s_dt = s if s.tzinfo else s.replace(tzinfo=timezone.utc)
+                s_dt = s if s.tzinfo else s.replace(tzinfo=_UTC)
             else:
                 # date
                 s_dt = datetime(s.year, s.month, s.day, 0, 0, tzinfo=tz)
             if isinstance(e, datetime):
-                e_dt = e if e.tzinfo else e.replace(tzinfo=timezone.utc)
+                e_dt = e if e.tzinfo else e.replace(tzinfo=_UTC)
             else:
                 e_dt = datetime(e.year, e.month, e.day, 23, 59, tzinfo=tz)
 
-            # Compare in a common tz
-            s_cmp = s_dt.astimezone(ZoneInfo("UTC"))
-            e_cmp = e_dt.astimezone(ZoneInfo("UTC"))
-            if e_cmp < start_dt.astimezone(ZoneInfo("UTC")) or s_cmp > end_dt.astimezone(ZoneInfo("UTC")):
+            # Convert once; aware datetimes compare correctly across zones
+            s_local = s_dt.astimezone(tz)
+            e_local = e_dt.astimezone(tz)
+            if e_local < start_dt or s_local > end_dt:
                 continue
 
+            title = _esc(summary or "(No title)")
+            location = _esc(location)
+            all_day = not isinstance(s, datetime)
             events.append({
-                "title": summary or "(No title)",
+                "title": title,
                 "location": location,
-                "description": description,
-                "start": s_dt.astimezone(ZoneInfo(tz_str)).isoformat(),
-                "end": e_dt.astimezone(ZoneInfo(tz_str)).isoformat(),
-                "all_day": not isinstance(dtstart.dt, datetime),
+                "description": _esc(description),
+                "start": s_local.isoformat(),
+                "end": e_local.isoformat(),
+                "all_day": all_day,
+                # Rendered here while the datetimes are at hand
+                "_html": _event_li(title, location, s_local, e_local, all_day, tz_str),
             })
     # sort by start time
     events.sort(key=lambda x: x["start"])
     return events
 
 def load_reminders(json_path, tz_str, end_dt):
+    try:
+        mtime = os.stat(json_path).st_mtime_ns
+    except OSError:
+        # Missing/unreadable file; let the loader report it
+        return _load_reminders(json_path, tz_str, end_dt)
+    key = [_MEMO_VERSION, json_path, mtime, tz_str, end_dt.isoformat()]
+    return _memo("reminders", key, lambda: _load_reminders(json_path, tz_str, end_dt))
+
+def _load_reminders(json_path, tz_str, end_dt):
     items = []
     try:
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(json_path, "rb") as f:
+            data = orjson.loads(f.read())
     except FileNotFoundError:
         logging.warning("Reminders JSON not found at %s", json_path)
         return items
@@ -127,8 +583,7 @@ def load_reminders(json_path, tz_str, end_dt):
         logging.exception("Failed to read reminders JSON")
         return items
 
-    tz = ZoneInfo(tz_str)
-    now = datetime.now(tz)
+    tz = _tz(tz_str)
 
     reminders_raw = data.get("reminders", [])
     reminders_list = []
@@ -139,21 +594,22 @@ def load_reminders(json_path, tz_str, end_dt):
             if not line:
                 continue
             try:
-                r = json.loads(line)
+                r = orjson.loads(line)
                 # If any fields contain multiple values separated by \n, split them
-                titles = r.get("title", "").split("\n")
-                dues = r.get("due", "").split("\n")
-                priorities = r.get("priority", "").split("\n")
-                notes = r.get("notes", "").split("\n")
-                lists = r.get("list", "").split("\n")
-                max_len = max(len(titles), len(dues), len(priorities), len(notes), len(lists))
-                for i in range(max_len):
+                for title, due, prio, note, lst in itertools.zip_longest(
+                    r.get("title", "").split("\n"),
+                    r.get("due", "").split("\n"),
+                    r.get("priority", "").split("\n"),
+                    r.get("notes", "").split("\n"),
+                    r.get("list", "").split("\n"),
+                    fillvalue="",
+                ):
                     reminders_list.append({
-                        "title": titles[i] if i < len(titles) else "",
-                        "due": dues[i] if i < len(dues) else "",
-                        "priority": priorities[i] if i < len(priorities) else "",
-                        "notes": notes[i] if i < len(notes) else "",
-                        "list": lists[i] if i < len(lists) else ""
+                        "title": title,
+                        "due": due,
+                        "priority": prio,
+                        "notes": note,
+                        "list": lst
                     })
             except Exception:
                 continue
@@ -175,47 +631,85 @@ def load_reminders(json_path, tz_str, end_dt):
         due_dt = None
         if due_raw:
             try:
-                due_dt = dateparser.parse(due_raw)
+                due_dt = _fast_parse(due_raw)
                 if due_dt.tzinfo is None:
-                    due_dt = due_dt.replace(tzinfo=timezone.utc).astimezone(tz)
+                    due_dt = due_dt.replace(tzinfo=_UTC).astimezone(tz)
                 else:
                     due_dt = due_dt.astimezone(tz)
             except Exception:
                 due_dt = None
 
-        include = True
         # If due date provided, include only if due before end_dt
         if due_dt is not None and due_dt > end_dt:
-            include = False
+            continue
 
         # Create a tuple of key fields to identify duplicates
-        key = (title.strip().lower(), due_dt.isoformat() if due_dt else None, list_name.strip().lower())
-        if include and key not in seen:
+        due_iso = due_dt.isoformat() if due_dt else None
+        key = (title.strip().lower(), due_iso, list_name.strip().lower())
+        if key not in seen:
             seen.add(key)
+            title = _esc(title)
+            list_name = _esc(list_name)
             items.append({
                 "title": title,
                 "list": list_name,
-                "priority": priority,
-                "notes": notes,
-                "due": due_dt.isoformat() if due_dt else None
+                "priority": _esc(priority),
+                "notes": _esc(notes),
+                "due": due_iso,
+                # Rendered here while due_dt is at hand
+                "_html": _reminder_li(title, list_name, due_dt, tz_str),
             })
 
     # sort: due date first, None at end
     items.sort(key=lambda x: (x["due"] is None, x["due"] or ""))
     return items
 
+WEATHER_CACHE = os.path.join(CACHE_DIR, "weather.json")
+_WEATHER_TTL = 30 * 60
+# key -> (fetched_at, response JSON) for repeat calls within one process
+_WEATHER_MEMO = {}
+
+def _load_weather_cache(key):
+    hit = _WEATHER_MEMO.get(tuple(key))
+    if hit and time.time() - hit[0] < _WEATHER_TTL:
+        return hit[1]
+    try:
+        if time.time() - os.path.getmtime(WEATHER_CACHE) >= _WEATHER_TTL:
+            return None
+        with open(WEATHER_CACHE, "rb") as f:
+            cached = orjson.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    return cached["data"] if cached.get("key") == key else None
+
+def _save_weather_cache(key, data):
+    _WEATHER_MEMO[tuple(key)] = (time.time(), data)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(WEATHER_CACHE, "wb") as f:
+            f.write(orjson.dumps({"key": key, "data": data}))
+    except OSError:
+        logging.warning("Could not write weather cache to %s", WEATHER_CACHE)
+
 def fetch_weather(api_key, lat, lon, units="imperial"):
     try:
-        url = "https://api.openweathermap.org/data/2.5/weather"
-        params = {"lat": lat, "lon": lon, "appid": api_key, "units": units}
-        r = requests.get(url, params=params, timeout=15)
-        r.raise_for_status()
-        data = r.json()
+        key = [lat, lon, units]
+        data = _load_weather_cache(key)
+        fresh = data is None
+        if fresh:
+            url = "https://api.openweathermap.org/data/2.5/weather"
+            params = {"lat": lat, "lon": lon, "appid": api_key, "units": units}
+            r = _SESSION.get(url, params=params, timeout=15)
+            r.raise_for_status()
+            data = orjson.loads(r.content)
         temp = round(data["main"]["temp"])
         feels = round(data["main"]["feels_like"])
-        desc = data["weather"][0]["description"].title()
+        desc = _esc(data["weather"][0]["description"].title())
         wind = round(data["wind"].get("speed", 0))
-        city = data.get("name", "")
+        city = _esc(data.get("name", ""))
+        # Only cache payloads that parsed, so a bad response isn't replayed for the TTL
+        if fresh:
+            _save_weather_cache(key, data)
         return {"temp": temp, "feels": feels, "desc": desc, "wind": wind, "city": city}
     except Exception:
         logging.exception("Weather fetch failed")
@@ -225,12 +719,12 @@ def fetch_quote(source="zenquotes"):
     # primary: ZenQuotes
     if source == "zenquotes":
         try:
-            r = requests.get("https://zenquotes.io/api/random", timeout=10)
+            r = _SESSION.get("https://zenquotes.io/api/random", timeout=10)
             r.raise_for_status()
-            js = r.json()
+            js = orjson.loads(r.content)
             q = js[0]["q"].strip()
             a = js[0]["a"].strip()
-            return f"“{q}” — {a}"
+            return _esc(f"“{q}” — {a}")
         except Exception:
             logging.exception("Quote fetch failed")
     # fallback quotes
@@ -245,23 +739,23 @@ def fetch_quote(source="zenquotes"):
 # -------------- Email --------------
 
 def send_email(smtp_cfg, from_addr, to_addrs, subject, html_body):
-    msg = MIMEMultipart('alternative')
+    msg = EmailMessage()
     msg['Subject'] = subject
     msg['From'] = from_addr
     msg['To'] = ", ".join(to_addrs)
-    part = MIMEText(html_body, 'html')
-    msg.attach(part)
+    msg.set_content("Your daily digest is best viewed in an HTML-capable email client.")
+    msg.add_alternative(html_body, subtype='html')
 
+    # One send per run; the with-block closes the socket even if starttls/login fail
     with smtplib.SMTP(smtp_cfg["server"], smtp_cfg["port"]) as server:
         server.starttls()
         server.login(smtp_cfg["username"], smtp_cfg["password"])
-        server.sendmail(from_addr, to_addrs, msg.as_string())
+        server.send_message(msg, from_addr, to_addrs)
 
 # -------------- HTML --------------
 
-def build_html(tz_str, date_title, reminders, events, weather, quote):
-    # Minimal, clean styling inline for email clients
-    style = """
+# Minimal, clean styling inline for email clients
+_STYLE = """
     <style>
         body { font-family: 'Segoe UI', 'Roboto', Arial, sans-serif; background: #f4f6fb; color: #22223b; margin: 0; }
         .wrap { max-width: 600px; margin: 32px auto; background: #fff; border-radius: 18px; box-shadow: 0 4px 24px #0001; padding: 32px 28px 24px 28px; }
@@ -279,99 +773,97 @@ def build_html(tz_str, date_title, reminders, events, weather, quote):
         .footer { color: #b0b3c6; font-size: 0.95em; margin-top: 22px; text-align: center; }
     </style>
     """
-    html = [f"<!doctype html><html><head>{style}</head><body><div class='wrap'>"]
+
+_TEMPLATE = (
+    "<!doctype html><html><head>{style}</head><body><div class='wrap'>"
+    "<h1>Daily Digest — {date_title}</h1>"
+    "<div class='greeting'>Hi, Paul. Happy {weekday}! This is your daily digest.</div>"
+    "<div class='card section'><h2>Weather</h2>{weather}</div>"
+    "<div class='card section'><h2>Upcoming Tasks</h2>{tasks}</div>"
+    "<div class='card section'><h2>Today's Events</h2>{events}</div>"
+    "<div class='card section'><h2>Motivation</h2><div class='quote'>{quote}</div></div>"
+    "<div class='footer'>Generated automatically.</div>"
+    "</div></body></html>"
+)
+
+def _reminder_li(title, list_name, due_dt, tz_str):
+    due = f" <span class='muted'>(due {human_time(due_dt, tz_str)})</span>" if due_dt else ""
+    listname = f" <span class='muted'>[{list_name}]</span>" if list_name else ""
+    return f"<li><span style='font-weight:500'>{title}</span>{listname}{due}</li>"
+
+def _event_li(title, location, start, end, all_day, tz_str):
+    if all_day:
+        badge = "<span class='all-day'>All‑day</span>"
+    else:
+        badge = f"<span class='event-time'>{human_time(start, tz_str)}–{human_time(end, tz_str)}</span>"
+    loc = f" <span class='muted'>— {location}</span>" if location else ""
+    return f"<li>{badge} <span style='font-weight:500'>{title}</span>{loc}</li>"
+
+def build_html(now, date_title, reminders, events, weather, quote):
+    # Text fields arrive HTML-escaped from the fetchers/loaders
     # Header first, then greeting with day
-    weekday = datetime.now(ZoneInfo(tz_str)).strftime('%A')
-    html.append(f"<h1>Daily Digest — {date_title}</h1>")
-    html.append(f"<div class='greeting'>Hi, Paul. Happy {weekday}! This is your daily digest.</div>")
+    weekday = now.strftime('%A')
 
-    # Weather
-    html.append("<div class='card section'>")
-    html.append("<h2>Weather</h2>")
     if weather:
         city = f" — {weather.get('city')}" if weather.get('city') else ""
-        html.append(f"<div><strong>{weather['desc']}</strong>{city}<br>")
-        html.append(f"Temp {weather['temp']}°, feels like {weather['feels']}°; wind {weather['wind']}.")
-        html.append("</div>")
+        weather_html = (
+            f"<div><strong>{weather['desc']}</strong>{city}<br>"
+            f"Temp {weather['temp']}°, feels like {weather['feels']}°; wind {weather['wind']}.</div>"
+        )
     else:
-        html.append("<div class='muted'>Weather unavailable.</div>")
-    html.append("</div>")
+        weather_html = "<div class='muted'>Weather unavailable.</div>"
 
-    # Reminders
-    html.append("<div class='card section'>")
-    html.append("<h2>Upcoming Tasks</h2>")
     if reminders:
-        html.append("<ul>")
-        for r in reminders:
-            due = ""
-            if r["due"]:
-                dt = datetime.fromisoformat(r["due"])
-                due = f" <span class='muted'>(due {human_time(dt, tz_str)})</span>"
-            listname = f" <span class='muted'>[{r['list']}]</span>" if r["list"] else ""
-            html.append(f"<li><span style='font-weight:500'>{r['title']}</span>{listname}{due}</li>")
-        html.append("</ul>")
+        tasks_html = "<ul>" + "".join(r["_html"] for r in reminders) + "</ul>"
     else:
-        html.append("<div class='muted'>No upcoming tasks.</div>")
-    html.append("</div>")
+        tasks_html = "<div class='muted'>No upcoming tasks.</div>"
 
-    # Events
-    html.append("<div class='card section'>")
-    html.append("<h2>Today's Events</h2>")
     if events:
-        html.append("<ul>")
-        for e in events:
-            start = datetime.fromisoformat(e["start"])
-            end = datetime.fromisoformat(e["end"])
-            if e["all_day"]:
-                when = "All‑day"
-                badge = f"<span class='all-day'>{when}</span>"
-                time_range = ""
-            else:
-                start_str = human_time(start, tz_str)
-                end_str = human_time(end, tz_str)
-                badge = f"<span class='event-time'>{start_str}–{end_str}</span>"
-                time_range = ""
-            loc = f" <span class='muted'>— {e['location']}</span>" if e['location'] else ""
-            html.append(f"<li>{badge} <span style='font-weight:500'>{e['title']}</span>{loc}</li>")
-        html.append("</ul>")
+        events_html = "<ul>" + "".join(e["_html"] for e in events) + "</ul>"
     else:
-        html.append("<div class='muted'>No events today.</div>")
-    html.append("</div>")
-
-    # Quote
-    html.append("<div class='card section'>")
-    html.append("<h2>Motivation</h2>")
-    html.append(f"<div class='quote'>{quote}</div>")
-    html.append("</div>")
-
-    html.append("<div class='footer'>Generated automatically.</div>")
-    html.append("</div></body></html>")
-    return "".join(html)
+        events_html = "<div class='muted'>No events today.</div>"
+
+    return _TEMPLATE.format_map({
+        "style": _STYLE,
+        "date_title": date_title,
+        "weekday": weekday,
+        "weather": weather_html,
+        "tasks": tasks_html,
+        "events": events_html,
+        "quote": quote,
+    })
 
 # -------------- Main --------------
 
 def main():
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    # httpx logs every request URL at INFO; calendar URLs embed their access token
+    logging.getLogger("httpx").setLevel(logging.WARNING)
 
     cfg = load_config()
     tz_str = cfg["digest"].get("time_zone", "America/New_York")
-    tz = ZoneInfo(tz_str)
+    tz = _tz(tz_str)
     days = int(cfg["digest"].get("days_ahead", 1))
     now = datetime.now(tz)
     start_dt = datetime(now.year, now.month, now.day, 0, 0, tzinfo=tz)
     end_dt = start_dt + timedelta(days=days) - timedelta(seconds=1)
 
     # Data
-    reminders = load_reminders(cfg["reminders"]["json_path"], tz_str, end_dt)
-    events = fetch_events(cfg["calendar"]["ics_urls"], tz_str, start_dt, end_dt)
-    weather = fetch_weather(cfg["weather"]["api_key"], cfg["weather"]["lat"], cfg["weather"]["lon"], cfg["weather"].get("units", "imperial"))
-    quote = fetch_quote(cfg.get("quote", {}).get("source", "zenquotes"))
+    # Network fetches are independent, so run them side by side; reminders are local disk
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        f_ev = ex.submit(fetch_events, cfg["calendar"]["ics_urls"], tz_str, start_dt, end_dt)
+        f_w = ex.submit(fetch_weather, cfg["weather"]["api_key"], cfg["weather"]["lat"], cfg["weather"]["lon"], cfg["weather"].get("units", "imperial"))
+        f_q = ex.submit(fetch_quote, cfg.get("quote", {}).get("source", "zenquotes"))
+        reminders = load_reminders(cfg["reminders"]["json_path"], tz_str, end_dt)
+        events = f_ev.result()
+        weather = f_w.result()
+        quote = f_q.result()
 
 
     date_title = human_date(now, tz_str)
     subject = f"{cfg['digest'].get('subject_prefix', '[Daily Digest]')} {date_title}"
 
-    html = build_html(tz_str, date_title, reminders, events, weather, quote)
+    html = build_html(now, date_title, reminders, events, weather, quote)
 
     if not cfg["digest"].get("send_empty", True):
         if not any([reminders, events, weather, quote]):
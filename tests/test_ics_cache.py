@@ -0,0 +1,67 @@
+import asyncio
+import os
+
+import httpx
+import pytest
+
+import daily_digest as dd
+
+URL = "webcal://calendar.example.com/feed.ics"
+BODY = b"BEGIN:VCALENDAR\r\nEND:VCALENDAR\r\n"
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(dd, "CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _fetch(handler):
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await dd._fetch_one(client, URL)
+    return asyncio.run(run())
+
+
+def _ok(request):
+    return httpx.Response(200, content=BODY, headers={"ETag": '"v1"'})
+
+
+def test_fetch_writes_body_and_validators():
+    body_path, sha1 = _fetch(_ok)
+    with open(body_path, "rb") as f:
+        assert f.read() == BODY
+    meta = dd._load_cache_meta(dd._cache_paths(URL)[0])
+    assert meta["etag"] == '"v1"' and meta["sha1"] == sha1
+
+
+def test_not_modified_reuses_cached_body():
+    first = _fetch(_ok)
+    seen = {}
+
+    def not_modified(request):
+        seen["etag"] = request.headers.get("If-None-Match")
+        return httpx.Response(304)
+
+    assert _fetch(not_modified) == first
+    assert seen["etag"] == '"v1"'
+
+
+def _unavailable(request):
+    return httpx.Response(503)
+
+
+def _timeout(request):
+    raise httpx.ReadTimeout("timed out", request=request)
+
+
+@pytest.mark.parametrize("failure", [_unavailable, _timeout])
+def test_failure_falls_back_to_cached_copy(failure):
+    first = _fetch(_ok)
+    assert _fetch(failure) == first
+    assert os.path.exists(first[0])
+
+
+def test_failure_without_cache_raises():
+    with pytest.raises(httpx.HTTPStatusError):
+        _fetch(_unavailable)
@@ -0,0 +1,222 @@
+import pickle
+import re
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import daily_digest as dd
+
+TZ_STR = "America/New_York"
+TZ = ZoneInfo(TZ_STR)
+
+WINDOWS_VTIMEZONE = """BEGIN:VTIMEZONE
+TZID:Eastern Standard Time
+BEGIN:STANDARD
+DTSTART:16010101T020000
+TZOFFSETFROM:-0400
+TZOFFSETTO:-0500
+RRULE:FREQ=YEARLY;BYDAY=1SU;BYMONTH=11
+END:STANDARD
+BEGIN:DAYLIGHT
+DTSTART:16010101T020000
+TZOFFSETFROM:-0500
+TZOFFSETTO:-0400
+RRULE:FREQ=YEARLY;BYDAY=2SU;BYMONTH=3
+END:DAYLIGHT
+END:VTIMEZONE
+"""
+
+
+def _ics(body):
+    text = "BEGIN:VCALENDAR\nVERSION:2.0\n" + body + "END:VCALENDAR\n"
+    return text.replace("\n", "\r\n").encode("utf-8")
+
+
+def _window(day):
+    start = datetime(day.year, day.month, day.day, tzinfo=TZ)
+    return start, start + timedelta(days=1) - timedelta(seconds=1)
+
+
+def _scan(raw, day=date(2026, 10, 14)):
+    start, end = _window(day)
+    return list(dd._scan_vevents(raw.splitlines(True), start, end))
+
+
+def _events(tmp_path, raw, day=date(2026, 10, 14)):
+    path = tmp_path / "feed.ics"
+    path.write_bytes(raw)
+    start, end = _window(day)
+    return dd._parse_events([("test", str(path))], TZ_STR, start, end)
+
+
+def test_folded_lines_are_joined():
+    raw = _ics(
+        "BEGIN:VEVENT\n"
+        "SUMMARY:Quarterly planning\n"
+        " session\n"
+        "DESCRIPTION:first\\nsecond\\, still second\n"
+        "\tthird\n"
+        "DTSTART:20261014T130000Z\n"
+        "END:VEVENT\n"
+    )
+    (event,) = _scan(raw)
+    assert event["summary"] == "Quarterly planningsession"
+    assert event["description"] == "first\nsecond, still secondthird"
+
+
+def test_fold_inside_multibyte_character():
+    raw = _ics("BEGIN:VEVENT\nSUMMARY:Caf\nDTSTART:20261014T130000Z\nEND:VEVENT\n")
+    # Fold between the two bytes of "é" (0xC3 0xA9), as RFC 5545 allows
+    raw = raw.replace(b"SUMMARY:Caf\r\n", b"SUMMARY:Caf\xc3\r\n \xa9 meeting\r\n")
+    (event,) = _scan(raw)
+    assert event["summary"] == "Café meeting"
+
+
+def test_iana_tzid():
+    raw = _ics(
+        "BEGIN:VEVENT\n"
+        "SUMMARY:Standup\n"
+        "DTSTART;TZID=America/Chicago:20261014T090000\n"
+        "DTEND;TZID=America/Chicago:20261014T091500\n"
+        "END:VEVENT\n"
+    )
+    (event,) = _scan(raw)
+    assert event["dtstart"] == datetime(2026, 10, 14, 9, 0, tzinfo=ZoneInfo("America/Chicago"))
+    assert event["dtend"].utcoffset() == timedelta(hours=-5)
+
+
+def test_windows_tzid_uses_vtimezone(tmp_path):
+    raw = _ics(
+        WINDOWS_VTIMEZONE
+        + "BEGIN:VEVENT\n"
+        "SUMMARY:Review\n"
+        "DTSTART;TZID=Eastern Standard Time:20261014T090000\n"
+        "DTEND;TZID=Eastern Standard Time:20261014T100000\n"
+        "END:VEVENT\n"
+    )
+    (event,) = _events(tmp_path, raw)
+    assert event["start"] == "2026-10-14T09:00:00-04:00"
+    assert event["end"] == "2026-10-14T10:00:00-04:00"
+    assert "9:00 AM–10:00 AM" in event["_html"]
+
+
+def test_vtimezone_after_the_events_using_it(tmp_path):
+    raw = _ics(
+        "BEGIN:VEVENT\n"
+        "SUMMARY:Review\n"
+        "DTSTART;TZID=Eastern Standard Time:20261014T090000\n"
+        "DTEND;TZID=Eastern Standard Time:20261014T100000\n"
+        "END:VEVENT\n"
+        "BEGIN:VEVENT\n"
+        "SUMMARY:Next week\n"
+        "DTSTART;TZID=Eastern Standard Time:20261021T090000\n"
+        "END:VEVENT\n"
+        + WINDOWS_VTIMEZONE
+    )
+    (event,) = _events(tmp_path, raw)
+    assert event["start"] == "2026-10-14T09:00:00-04:00"
+    assert event["end"] == "2026-10-14T10:00:00-04:00"
+
+
+def test_unknown_tzid_without_vtimezone_stays_floating():
+    raw = _ics("BEGIN:VEVENT\nSUMMARY:Odd\nDTSTART;TZID=Nowhere Time:20261014T090000\nEND:VEVENT\n")
+    (event,) = _scan(raw)
+    assert event == {"summary": "Odd", "dtstart": datetime(2026, 10, 14, 9, 0)}
+
+
+def test_vtimezone_matches_zoneinfo_across_dst():
+    raw = _ics(WINDOWS_VTIMEZONE + "BEGIN:VEVENT\nDTSTART;TZID=Eastern Standard Time:20261014T090000\nEND:VEVENT\n")
+    (event,) = _scan(raw)
+    vtz = event["dtstart"].tzinfo
+    for day in (date(2026, 1, 15), date(2026, 3, 9), date(2026, 7, 4), date(2026, 11, 2), date(2027, 11, 8)):
+        local = datetime(day.year, day.month, day.day, 12, 0)
+        assert local.replace(tzinfo=vtz).utcoffset() == local.replace(tzinfo=TZ).utcoffset(), day
+    # Must survive the trip to a _scan_feeds worker process
+    assert pickle.loads(pickle.dumps(vtz)).utcoffset(datetime(2026, 7, 4)) == timedelta(hours=-4)
+
+
+def test_value_date_is_all_day(tmp_path):
+    raw = _ics(
+        "BEGIN:VEVENT\n"
+        "SUMMARY:Holiday\n"
+        "DTSTART;VALUE=DATE:20261014\n"
+        "DTEND;VALUE=DATE:20261015\n"
+        "END:VEVENT\n"
+    )
+    (event,) = _events(tmp_path, raw)
+    assert event["all_day"] is True
+    assert event["start"] == "2026-10-14T00:00:00-04:00"
+
+
+def test_nested_valarm_properties_are_ignored():
+    raw = _ics(
+        "BEGIN:VEVENT\n"
+        "SUMMARY:Dentist\n"
+        "DTSTART:20261014T140000Z\n"
+        "BEGIN:VALARM\n"
+        "ACTION:DISPLAY\n"
+        "DESCRIPTION:Reminder\n"
+        "SUMMARY:Alarm\n"
+        "END:VALARM\n"
+        "LOCATION:Main St\n"
+        "END:VEVENT\n"
+    )
+    (event,) = _scan(raw)
+    assert event["summary"] == "Dentist"
+    assert event["location"] == "Main St"
+    assert "description" not in event
+
+
+def test_component_names_are_case_insensitive():
+    lowered_vtimezone = re.sub(r"^(BEGIN|END):\w+$", lambda m: m.group(0).lower(), WINDOWS_VTIMEZONE, flags=re.M)
+    raw = _ics(
+        lowered_vtimezone
+        + "begin:vevent\n"
+        "summary:Lower\n"
+        "dtstart;TZID=Eastern Standard Time:20261014T090000\n"
+        "begin:valarm\n"
+        "summary:Alarm\n"
+        "end:valarm\n"
+        "End:VEvent\n"
+    )
+    (event,) = _scan(raw)
+    assert event["summary"] == "Lower"
+    assert event["dtstart"].utcoffset() == timedelta(hours=-4)
+
+
+def test_events_after_window_are_dropped():
+    raw = _ics(
+        "BEGIN:VEVENT\nSUMMARY:Today\nDTSTART:20261014T140000Z\nEND:VEVENT\n"
+        "BEGIN:VEVENT\nSUMMARY:Next week\nDTSTART:20261021T140000Z\nEND:VEVENT\n"
+    )
+    assert [e["summary"] for e in _scan(raw)] == ["Today"]
+
+
+def _two_feeds(tmp_path):
+    raw = _ics("BEGIN:VEVENT\nSUMMARY:Today\nDTSTART:20261014T140000Z\nEND:VEVENT\n")
+    feeds = []
+    for name in ("a", "b"):
+        path = tmp_path / f"{name}.ics"
+        path.write_bytes(raw)
+        feeds.append((name, str(path)))
+    return feeds
+
+
+def test_small_feeds_scan_inline(tmp_path, monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool started for small feeds")
+
+    monkeypatch.setattr(dd, "ProcessPoolExecutor", no_pool)
+    monkeypatch.setattr(dd.os, "cpu_count", lambda: 4)
+    start, end = _window(date(2026, 10, 14))
+    results = dd._scan_feeds(_two_feeds(tmp_path), start, end)
+    assert [[e["summary"] for e in r] for r in results] == [["Today"], ["Today"]]
+
+
+def test_large_feeds_use_spawned_pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(dd, "_SCAN_POOL_MIN_BYTES", 0)
+    monkeypatch.setattr(dd.os, "cpu_count", lambda: 2)
+    start, end = _window(date(2026, 10, 14))
+    feeds = _two_feeds(tmp_path) + [("missing", str(tmp_path / "missing.ics"))]
+    *ok, missing = dd._scan_feeds(feeds, start, end)
+    assert [[e["summary"] for e in r] for r in ok] == [["Today"], ["Today"]]
+    assert isinstance(missing, FileNotFoundError)
@@ -0,0 +1,62 @@
+import smtplib
+
+import pytest
+
+import daily_digest as dd
+
+SMTP_CFG = {"server": "smtp.example.com", "port": 587, "username": "u", "password": "p"}
+
+
+class FakeSMTP:
+    instances = []
+    fail_login = False
+
+    def __init__(self, host, port):
+        self.closed = False
+        self.sent = []
+        FakeSMTP.instances.append(self)
+
+    def starttls(self):
+        pass
+
+    def login(self, username, password):
+        if FakeSMTP.fail_login:
+            raise smtplib.SMTPAuthenticationError(535, b"bad credentials")
+
+    def send_message(self, msg, from_addr, to_addrs):
+        self.sent.append((msg, from_addr, to_addrs))
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+@pytest.fixture(autouse=True)
+def fake_smtp(monkeypatch):
+    FakeSMTP.instances = []
+    FakeSMTP.fail_login = False
+    monkeypatch.setattr(smtplib, "SMTP", FakeSMTP)
+
+
+def test_send_email_builds_html_alternative():
+    dd.send_email(SMTP_CFG, "me@example.com", ["a@example.com", "b@example.com"], "Subject", "<p>Hi</p>")
+    (server,) = FakeSMTP.instances
+    (msg, from_addr, to_addrs), = server.sent
+    assert to_addrs == ["a@example.com", "b@example.com"]
+    assert msg["To"] == "a@example.com, b@example.com"
+    assert msg.get_body(("html",)).get_content().strip() == "<p>Hi</p>"
+    assert server.closed
+
+
+def test_send_email_closes_socket_on_failed_login():
+    FakeSMTP.fail_login = True
+    with pytest.raises(smtplib.SMTPAuthenticationError):
+        dd.send_email(SMTP_CFG, "me@example.com", ["a@example.com"], "Subject", "<p>Hi</p>")
+    (server,) = FakeSMTP.instances
+    assert server.closed
+    assert not server.sent
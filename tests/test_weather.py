@@ -0,0 +1,43 @@
+import daily_digest as dd
+import orjson
+import pytest
+
+GOOD = {"main": {"temp": 50.4, "feels_like": 47.6}, "weather": [{"description": "clear sky"}],
+        "wind": {"speed": 3.2}, "name": "Town & Country"}
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.content = orjson.dumps(payload)
+
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture
+def responses(tmp_path, monkeypatch):
+    monkeypatch.setattr(dd, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(dd, "WEATHER_CACHE", str(tmp_path / "weather.json"))
+    monkeypatch.setattr(dd, "_WEATHER_MEMO", {})
+    queue = []
+
+    def fake_get(url, params=None, timeout=None):
+        return FakeResponse(queue.pop(0))
+
+    monkeypatch.setattr(dd._SESSION, "get", fake_get)
+    return queue
+
+
+def test_weather_is_cached_between_calls(responses):
+    responses.append(GOOD)
+    first = dd.fetch_weather("key", 1.0, 2.0)
+    assert first == {"temp": 50, "feels": 48, "desc": "Clear Sky", "wind": 3, "city": "Town &amp; Country"}
+    dd._WEATHER_MEMO.clear()
+    # Served from the disk cache: no response left in the queue
+    assert dd.fetch_weather("key", 1.0, 2.0) == first
+
+
+def test_bad_payload_is_not_cached(responses):
+    responses.extend([{"cod": 200, "message": "partial"}, GOOD])
+    assert dd.fetch_weather("key", 1.0, 2.0) is None
+    assert dd.fetch_weather("key", 1.0, 2.0)["temp"] == 50